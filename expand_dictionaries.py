@@ -5,103 +5,255 @@ For derived words (plurals, past tense, etc.), it stores the base word's definit
 directly so the game doesn't need to look up multiple dictionaries.
 
 The definition is prefixed with the relation (e.g., "Plural of WORD: [definition]")
+and the entry is tagged with 't': 'd' so later runs can skip it.
 """
 
 import json
-import urllib.request
+import pickle
 import re
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 WORD_DATA_DIR = Path(__file__).parent / "word-data"
 
+# Word lengths the games use (one words<N>.json file per length)
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 7
+
 # URLs for comprehensive word lists
 DWYL_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
 
-# Common word form patterns - order matters (more specific first)
+# A whole line of letters in the (upper-cased) DWYL file
+WORD_LINE_RE = re.compile(rb'^([A-Z]+)\r?$', re.MULTILINE)
+
+# Local copy of the DWYL list, revalidated with its ETag on each run
+CACHE_DIR = WORD_DATA_DIR / ".cache"
+DWYL_CACHE_FILE = CACHE_DIR / "words_alpha.txt"
+DWYL_CACHE_META = CACHE_DIR / "words_alpha.json"
+DWYL_WORDS_CACHE = CACHE_DIR / "words_alpha.pickle"
+
+# Common word form rules - order matters (more specific first)
 # These are designed to be conservative to avoid false positives
+#
+# Each rule is (suffix, make_bases): every make_base gets the word with the
+# suffix removed (never empty) and returns the candidate base word, or None if
+# it doesn't apply. Rules work directly on the upper-case words used throughout
+# word-data, so no case conversion happens per word. Rules sharing a suffix are
+# grouped so the suffix is tested and the stem sliced once, then reused for
+# each candidate. Plain string slicing is much cheaper than running a regex per
+# pattern for every word in the DWYL list.
 
-PLURAL_PATTERNS = [
-    (r'^(.+)ies$', r'\1y'),      # babies -> baby
-    (r'^(.+)ves$', r'\1f'),      # wolves -> wolf
-    (r'^(.+)ves$', r'\1fe'),     # wives -> wife
-    (r'^(.+[sxz])es$', r'\1'),   # boxes -> box
-    (r'^(.+[cs]h)es$', r'\1'),   # churches -> church
-    (r'^(.+)s$', r'\1'),         # cats -> cat (not es - too many false positives)
+VOWELS = 'AEIOU'
+
+
+def _undouble(stem):
+    """Drop a doubled final consonant (stopp -> stop), or None if there isn't one."""
+    if len(stem) > 2 and stem[-1] == stem[-2] and stem[-1] not in VOWELS:
+        return stem[:-1]
+    return None
+
+
+PLURAL_RULES = [
+    ('IES', (lambda s: s + 'Y',)),     # babies -> baby
+    ('VES', (lambda s: s + 'F',        # wolves -> wolf
+             lambda s: s + 'FE')),     # wives -> wife
+    ('ES', (lambda s: s if len(s) > 1 and s[-1] in 'SXZ' else None,            # boxes -> box
+            lambda s: s if len(s) > 2 and s[-2:] in ('CH', 'SH') else None)),  # churches -> church
+    ('S', (lambda s: s,)),             # cats -> cat (not es - too many false positives)
 ]
 
-PAST_TENSE_PATTERNS = [
-    (r'^(.+)ied$', r'\1y'),      # carried -> carry
-    (r'^(.+)([^aeiou])\2ed$', r'\1\2'),  # stopped -> stop
-    (r'^(.+[^e])ed$', r'\1e'),   # loved -> love (only if not already ending in e)
-    (r'^(.+)ed$', r'\1'),        # walked -> walk
+PAST_TENSE_RULES = [
+    ('IED', (lambda s: s + 'Y',)),     # carried -> carry
+    ('ED', (_undouble,                 # stopped -> stop
+            lambda s: s + 'E' if len(s) > 1 and s[-1] != 'E' else None,  # loved -> love (only if not already ending in e)
+            lambda s: s)),             # walked -> walk
 ]
 
-PRESENT_PARTICIPLE_PATTERNS = [
-    (r'^(.+)ying$', r'\1y'),     # carrying -> carry  
-    (r'^(.+)([^aeiou])\2ing$', r'\1\2'),  # stopping -> stop
-    (r'^(.+)ing$', r'\1e'),      # loving -> love
-    (r'^(.+)ing$', r'\1'),       # walking -> walk
+PRESENT_PARTICIPLE_RULES = [
+    ('YING', (lambda s: s + 'Y',)),    # carrying -> carry
+    ('ING', (_undouble,                # stopping -> stop
+             lambda s: s + 'E',        # loving -> love
+             lambda s: s)),            # walking -> walk
 ]
 
 # Be very conservative with comparative/superlative - many words ending in -er/-est are NOT comparatives
-COMPARATIVE_PATTERNS = [
-    (r'^(.+)ier$', r'\1y'),      # happier -> happy
-    (r'^(.+)([^aeiou])\2er$', r'\1\2'),  # bigger -> big (doubled consonant only)
+COMPARATIVE_RULES = [
+    ('IER', (lambda s: s + 'Y',)),     # happier -> happy
+    ('ER', (_undouble,)),              # bigger -> big (doubled consonant only)
 ]
 
-SUPERLATIVE_PATTERNS = [
-    (r'^(.+)iest$', r'\1y'),     # happiest -> happy
-    (r'^(.+)([^aeiou])\2est$', r'\1\2'),  # biggest -> big (doubled consonant only)
+SUPERLATIVE_RULES = [
+    ('IEST', (lambda s: s + 'Y',)),    # happiest -> happy
+    ('EST', (_undouble,)),             # biggest -> big (doubled consonant only)
 ]
 
-ALL_PATTERNS = [
-    ('Plural of', PLURAL_PATTERNS),
-    ('Past tense of', PAST_TENSE_PATTERNS),
-    ('Present participle of', PRESENT_PARTICIPLE_PATTERNS),
-    ('Comparative form of', COMPARATIVE_PATTERNS),
-    ('Superlative form of', SUPERLATIVE_PATTERNS),
+ALL_RULES = [
+    ('Plural of', PLURAL_RULES),
+    ('Past tense of', PAST_TENSE_RULES),
+    ('Present participle of', PRESENT_PARTICIPLE_RULES),
+    ('Comparative form of', COMPARATIVE_RULES),
+    ('Superlative form of', SUPERLATIVE_RULES),
 ]
 
+# Prefixes of the definitions written for derived words
+RELATIONS = tuple(relation for relation, _ in ALL_RULES)
+
+
+def build_suffix_trie(all_rules):
+    """
+    Index the rules by reversed suffix, so one walk back from the end of a word
+    finds every rule that applies ('IES', 'ES' and 'S' share the path S-E-I).
+    Each node keeps the rules whose suffix ends there under the None key, as
+    (order, relation, suffix_length, make_bases) with order the rule's position
+    in all_rules.
+    """
+    trie = {}
+    order = 0
+    for relation, rules in all_rules:
+        for suffix, make_bases in rules:
+            node = trie
+            for ch in reversed(suffix):
+                node = node.setdefault(ch, {})
+            node.setdefault(None, []).append((order, relation, len(suffix), make_bases))
+            order += 1
+    return trie
+
+
+SUFFIX_TRIE = build_suffix_trie(ALL_RULES)
+
+
+def parse_words(raw):
+    """
+    Extract the set of upper-case words from the raw DWYL file.
+    Words longer than MAX_WORD_LENGTH are dropped: they can't be game words,
+    and a base is always shorter than the word derived from it. That leaves
+    a much smaller set to hold in memory and probe.
+    """
+    # One regex pass over the raw bytes picks out every all-letter line
+    return {w.decode('ascii') for w in WORD_LINE_RE.findall(raw.upper()) if len(w) <= MAX_WORD_LENGTH}
+
+
+def write_cache_file(path, data):
+    """Write bytes to a cache file via a temp file, so a crash can't leave a partial copy."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def load_cached_words():
+    """
+    Load the word set from the local cache, parsing the raw copy if needed.
+    Returns None if there is no usable cached copy.
+    """
+    if DWYL_WORDS_CACHE.exists():
+        try:
+            with open(DWYL_WORDS_CACHE, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # A damaged pickle can fail in many ways; the raw copy rebuilds it
+            print(f"Discarding unreadable word cache: {e}")
+            DWYL_WORDS_CACHE.unlink(missing_ok=True)
+    try:
+        words = parse_words(DWYL_CACHE_FILE.read_bytes())
+    except OSError:
+        return None
+    try:
+        write_cache_file(DWYL_WORDS_CACHE, pickle.dumps(words, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        print(f"Could not save word cache: {e}")
+    return words
+
 
 def download_words():
-    """Download comprehensive word list."""
+    """Download comprehensive word list, reusing the cached copy if unchanged."""
     print(f"Downloading word list from {DWYL_URL}...")
+    
+    etag = None
+    if DWYL_CACHE_FILE.exists() and DWYL_CACHE_META.exists():
+        try:
+            with open(DWYL_CACHE_META, 'r') as f:
+                etag = json.load(f).get('etag')
+        except (OSError, ValueError):
+            pass  # Unreadable: just download the list unconditionally
+    
     try:
-        with urllib.request.urlopen(DWYL_URL) as response:
-            content = response.read().decode('utf-8')
-            words = {line.strip().upper() for line in content.split('\n') if line.strip() and line.strip().isalpha()}
-            print(f"Downloaded {len(words)} words")
-            return words
+        request = urllib.request.Request(DWYL_URL, headers={'If-None-Match': etag} if etag else {})
+        try:
+            with urllib.request.urlopen(request) as response:
+                raw = response.read()
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            words = load_cached_words()
+            if words is not None:
+                print(f"Word list unchanged, using cached copy ({len(words)} words)")
+                return words
+            # The cached copy is gone after all: fetch the full list
+            with urllib.request.urlopen(DWYL_URL) as response:
+                raw = response.read()
+                etag = response.headers.get('ETag')
+        
+        words = parse_words(raw)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # The ETag is written last, so it only ever describes a complete cache
+        write_cache_file(DWYL_CACHE_FILE, raw)
+        write_cache_file(DWYL_WORDS_CACHE, pickle.dumps(words, protocol=pickle.HIGHEST_PROTOCOL))
+        write_cache_file(DWYL_CACHE_META, json.dumps({'etag': etag}).encode())
+        print(f"Downloaded {len(words)} words")
+        return words
     except Exception as e:
         print(f"Error downloading: {e}")
+        words = load_cached_words()
+        if words is not None:
+            print(f"Using cached copy ({len(words)} words)")
+            return words
         return set()
 
 
-def find_base_word(word, all_dictionaries, all_words):
+def find_base_word(word, base_index, all_words):
     """
     Try to find the base word for a derived form.
+    base_index maps every known dictionary word (any length) to its info.
     Returns (base_word, relation, base_info) or (None, None, None).
     """
-    word_lower = word.lower()
+    # Collect the rules whose suffix the word ends with. Most words fall out on
+    # their last letter; the walk stops one letter short of the whole word
+    # because the stem is never empty.
+    node = SUFFIX_TRIE.get(word[-1]) if len(word) > 1 else None
+    if node is None:
+        return None, None, None
+    matches = list(node.get(None, ()))
+    for i in range(len(word) - 2, 0, -1):
+        node = node.get(word[i])
+        if node is None:
+            break
+        matches += node.get(None, ())
     
-    for relation, patterns in ALL_PATTERNS:
-        for pattern, replacement in patterns:
-            match = re.match(pattern, word_lower)
-            if match:
-                base = re.sub(pattern, replacement, word_lower).upper()
-                # Check if base word exists
-                if base in all_words and len(base) < len(word):
-                    # Try to find base word info in dictionaries
-                    for length, data in all_dictionaries.items():
-                        if base in data:
-                            base_info = data[base]
-                            # Only use if base has a real definition
-                            if base_info.get('d') and len(base_info['d']) > 5:
-                                # Don't use if base is itself a reference
-                                if not base_info.get('base'):
-                                    return base, relation, base_info
-                    # Base exists but no definition found
-                    return base, relation, None
+    # Try them in rule-table order, not suffix-length order (orders are unique,
+    # so the sort never compares past the first field)
+    if len(matches) > 1:
+        matches.sort()
+    
+    for _, relation, suffix_length, make_bases in matches:
+        stem = word[:-suffix_length]
+        for make_base in make_bases:
+            base = make_base(stem)
+            if base is None:
+                continue
+            # Check if base word exists
+            if base in all_words and len(base) < len(word):
+                # Try to find base word info in dictionaries
+                base_info = base_index.get(base)
+                if base_info is not None:
+                    # Only use if base has a real definition
+                    if base_info.get('d') and len(base_info['d']) > 5:
+                        # Don't use if base is itself a reference
+                        if not base_info.get('base'):
+                            return base, relation, base_info
+                # Base exists but no definition found
+                return base, relation, None
     
     return None, None, None
 
@@ -119,10 +271,11 @@ def load_existing_wordlist(length):
 def save_wordlist(length, data):
     """Save word list JSON file."""
     filepath = WORD_DATA_DIR / f"words{length}.json"
-    # Sort by key for consistent output
+    # Sort by key for consistent output. json.dumps encodes in one shot with the
+    # C encoder, whereas json.dump streams chunks through the pure-Python one.
     sorted_data = dict(sorted(data.items()))
     with open(filepath, 'w') as f:
-        json.dump(sorted_data, f, separators=(',', ':'))
+        f.write(json.dumps(sorted_data, separators=(',', ':')))
     print(f"Saved {len(data)} words to {filepath}")
 
 
@@ -140,19 +293,31 @@ def main():
     # Load all existing dictionaries first
     print("\nLoading existing dictionaries...")
     all_dictionaries = {}
-    for length in range(3, 8):
+    base_index = {}
+    for length in range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1):
         data = load_existing_wordlist(length)
         all_dictionaries[length] = data
+        base_index.update(data)
         print(f"  words{length}.json: {len(data)} words")
     
-    # Process each word length
+    # Bucket downloaded words by length in a single pass
+    buckets = {length: [] for length in range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1)}
+    for word in all_words:
+        bucket = buckets.get(len(word))
+        if bucket is not None:
+            bucket.append(word)
+    for bucket in buckets.values():
+        bucket.sort()
+    
+    # Process each word length, shortest first. Lengths are not independent:
+    # base_index is refreshed after each one, and an existing entry rewritten as
+    # a derived form stops being a usable base for the longer words after it.
+    # (Each length takes well under a second anyway, far less than the cost of
+    # shipping the word set and index to worker processes.)
     print("\nExpanding dictionaries...")
-    for length in range(3, 8):
+    for length in range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1):
         print(f"\nProcessing {length}-letter words...")
         
-        # Filter downloaded words to this length
-        length_words = {w for w in all_words if len(w) == length}
-        
         # Start with existing data
         data = dict(all_dictionaries[length])
         
@@ -160,29 +325,37 @@ def main():
         derived_with_def = 0
         derived_without_def = 0
         
-        for word in sorted(length_words):
-            if word in data:
-                # Update existing entry if it's derived but missing base definition
-                info = data[word]
-                if info.get('base') and info.get('d', '').startswith(('Plural of', 'Past tense of', 'Present participle of', 'Comparative form of', 'Superlative form of')):
+        for word in buckets[length]:
+            info = data.get(word)
+            if info is not None:
+                # Derived entries are tagged 't': 'd' when written
+                if info.get('t') == 'd':
                     # Already processed
                     continue
+                
+                # Update existing entry if it's derived but missing base definition
+                definition = info.get('d') or ''
+                if info.get('base') and definition.startswith(RELATIONS):
+                    # Derived entry from before the tag existed: tag it and move on
+                    info['t'] = 'd'
+                    continue
                     
                 # Check if current definition is just a placeholder
-                if not info.get('d') or len(info['d']) < 10:
-                    base, relation, base_info = find_base_word(word, all_dictionaries, all_words)
+                if len(definition) < 10:
+                    base, relation, base_info = find_base_word(word, base_index, all_words)
                     if base and base_info and base_info.get('d'):
                         data[word] = {
                             'd': f"{relation} {base}: {base_info['d']}",
                             'e': base_info.get('e', ''),
                             'base': base,
-                            'relation': relation
+                            'relation': relation,
+                            't': 'd'
                         }
                         derived_with_def += 1
                 continue
             
             # New word
-            base, relation, base_info = find_base_word(word, all_dictionaries, all_words)
+            base, relation, base_info = find_base_word(word, base_index, all_words)
             
             if base:
                 if base_info and base_info.get('d'):
@@ -191,7 +364,8 @@ def main():
                         'd': f"{relation} {base}: {base_info['d']}",
                         'e': base_info.get('e', ''),
                         'base': base,
-                        'relation': relation
+                        'relation': relation,
+                        't': 'd'
                     }
                     derived_with_def += 1
                 else:
@@ -200,7 +374,8 @@ def main():
                         'd': f"{relation} {base}.",
                         'e': '',
                         'base': base,
-                        'relation': relation
+                        'relation': relation,
+                        't': 'd'
                     }
                     derived_without_def += 1
             else:
@@ -215,6 +390,7 @@ def main():
         
         # Update our reference
         all_dictionaries[length] = data
+        base_index.update(data)
         
         # Save
         save_wordlist(length, data)
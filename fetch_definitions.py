@@ -6,12 +6,16 @@ Uses the Free Dictionary API: https://dictionaryapi.dev/
 
 import json
 import time
-import urllib.request
-import urllib.error
+import threading
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # API endpoint
 API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 
@@ -19,67 +23,155 @@ API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 REQUESTS_PER_SECOND = 2
 DELAY_BETWEEN_REQUESTS = 1.0 / REQUESTS_PER_SECOND
 
+# Concurrent requests in flight (they still share the rate limit above)
+MAX_WORKERS = 16
+
+# One keep-alive session for every lookup, so the TCP/TLS handshake is paid
+# once per pooled connection rather than once per word
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (word-puzzle-games definition fetcher)'})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=MAX_WORKERS,
+    # Retry transient errors with backoff; hand back the last response rather than raising
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                      raise_on_status=False),
+))
+
+# Raw API responses, sharded by the first two letters of the word, so lookups
+# can be re-extracted later without hitting the API again
+API_CACHE_DIR = Path("word-data") / ".cache" / "api"
+
 # Progress file to allow resuming
 PROGRESS_FILE = "fetch_definitions_progress.json"
 
+class RateLimiter:
+    """Token bucket shared by all worker threads: one request per interval."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until this thread's request slot comes round."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 def load_progress():
     """Load progress from file to allow resuming."""
     if os.path.exists(PROGRESS_FILE):
         with open(PROGRESS_FILE, 'r') as f:
-            return json.load(f)
+            progress = json.load(f)
+        # Completed words are stored as lists but checked as sets
+        progress["completed"] = {name: set(words) for name, words in progress["completed"].items()}
+        return progress
     return {"completed": {}, "failed": {}}
 
 def save_progress(progress):
     """Save progress to file."""
-    with open(PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+    data = {
+        "completed": {name: sorted(words) for name, words in progress["completed"].items()},
+        "failed": progress["failed"],
+    }
+    # Write to a temp file and swap it in, so Ctrl-C mid-write can't corrupt
+    # the progress file
+    tmp_path = PROGRESS_FILE + ".tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(json.dumps(data, indent=2))
+    os.replace(tmp_path, PROGRESS_FILE)
+
+def extract_definition(data):
+    """Pull the definition and etymology out of a parsed API response."""
+    if not data or not isinstance(data, list) or len(data) == 0:
+        return None, None, "empty_response"
+    
+    entry = data[0]
+    
+    # Extract definition
+    definition = ""
+    if entry.get("meanings"):
+        for meaning in entry["meanings"]:
+            if meaning.get("definitions"):
+                part_of_speech = meaning.get("partOfSpeech", "")
+                first_def = meaning["definitions"][0].get("definition", "")
+                if first_def:
+                    definition = f"({part_of_speech}) {first_def}" if part_of_speech else first_def
+                    break
+    
+    # Extract etymology
+    etymology = ""
+    if entry.get("origin"):
+        etymology = entry["origin"]
+    
+    return definition, etymology, "success"
 
-def fetch_definition(word):
-    """Fetch definition and etymology from the API."""
+def fetch_definition(word, rate_limiter=None):
+    """Fetch definition and etymology, from the local cache or else the API."""
     try:
-        url = API_URL.format(word=word.lower())
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (word-puzzle-games definition fetcher)'})
+        word = word.lower()
+        cache_path = API_CACHE_DIR / word[:2] / f"{word}.json"
+        if cache_path.exists():
+            return extract_definition(json.loads(cache_path.read_bytes()))
         
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status != 200:
-                return None, None, f"http_{response.status}"
-            
-            data = json.loads(response.read().decode('utf-8'))
+        # Only requests that actually go to the API count against the rate limit
+        if rate_limiter:
+            rate_limiter.wait()
         
-        if not data or not isinstance(data, list) or len(data) == 0:
-            return None, None, "empty_response"
+        url = API_URL.format(word=word)
+        response = SESSION.get(url, timeout=10)
         
-        entry = data[0]
+        if response.status_code == 404:
+            return None, None, "not_found"
+        if response.status_code != 200:
+            return None, None, f"http_{response.status_code}"
         
-        # Extract definition
-        definition = ""
-        if entry.get("meanings"):
-            for meaning in entry["meanings"]:
-                if meaning.get("definitions"):
-                    part_of_speech = meaning.get("partOfSpeech", "")
-                    first_def = meaning["definitions"][0].get("definition", "")
-                    if first_def:
-                        definition = f"({part_of_speech}) {first_def}" if part_of_speech else first_def
-                        break
+        data = json.loads(response.content)
         
-        # Extract etymology
-        etymology = ""
-        if entry.get("origin"):
-            etymology = entry["origin"]
+        # Write via a temp file so an interrupted run can't leave a truncated entry
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, cache_path)
         
-        return definition, etymology, "success"
+        return extract_definition(data)
         
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None, None, "not_found"
-        return None, None, f"http_{e.code}"
-    except urllib.error.URLError as e:
+    except requests.exceptions.RequestException as e:
         return None, None, f"url_error: {str(e)}"
     except json.JSONDecodeError:
         return None, None, "json_error"
     except Exception as e:
         return None, None, f"error: {str(e)}"
 
+def save_word_data(filepath, word_data):
+    """Write the full word data back to its JSON file."""
+    with open(filepath, 'w') as f:
+        f.write(json.dumps(word_data, separators=(',', ':')))
+
+def replay_updates(word_data, updates_path):
+    """Apply definitions logged by an interrupted run. Returns how many were applied."""
+    if not os.path.exists(updates_path):
+        return 0
+    
+    applied = 0
+    with open(updates_path, 'r') as f:
+        for line in f:
+            try:
+                update = json.loads(line)
+            except json.JSONDecodeError:
+                # Partially written last line from a hard kill
+                continue
+            info = word_data.get(update["w"])
+            if info is not None:
+                info["d"] = update["d"]
+                info["e"] = update["e"]
+                applied += 1
+    return applied
+
 def process_word_file(filepath, progress):
     """Process a single word file, fetching missing definitions."""
     print(f"\n{'='*60}")
@@ -92,74 +184,87 @@ def process_word_file(filepath, progress):
     
     filename = os.path.basename(filepath)
     
+    # New definitions are appended to a small log as they arrive and merged
+    # into the word file once at the end, instead of rewriting it every 50 words
+    updates_path = filepath + ".updates.jsonl"
+    replayed = replay_updates(word_data, updates_path)
+    if replayed:
+        print(f"Recovered {replayed} definitions from an interrupted run")
+    
     # Initialize progress for this file if not exists
     if filename not in progress["completed"]:
-        progress["completed"][filename] = []
+        progress["completed"][filename] = set()
     if filename not in progress["failed"]:
         progress["failed"][filename] = {}
     
-    # Find words that need definitions
-    words_needing_defs = []
-    for word, info in word_data.items():
-        # Skip if already has definition or is a derived form with base
-        if info.get("d") or info.get("base"):
-            continue
-        # Skip if already processed
-        if word in progress["completed"][filename]:
-            continue
-        if word in progress["failed"][filename]:
-            continue
-        words_needing_defs.append(word)
+    # Find words that need definitions: skip any that already have one, are a
+    # derived form with a base, or were already processed
+    completed = progress["completed"][filename]
+    failed = progress["failed"][filename]
+    words_needing_defs = [
+        word for word, info in word_data.items()
+        if not info.get("d") and not info.get("base") and word not in completed and word not in failed
+    ]
     
     total_words = len(words_needing_defs)
     print(f"Words needing definitions: {total_words}")
     
     if total_words == 0:
         print("No words to process!")
+        if replayed:
+            save_word_data(filepath, word_data)
+            os.remove(updates_path)
         return word_data, 0, 0
     
     success_count = 0
     fail_count = 0
-    modified = False
+    modified = replayed > 0
     
-    for i, word in enumerate(words_needing_defs):
-        # Progress indicator
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"  [{i+1}/{total_words}] Processing {word}...", end="", flush=True)
-        
-        definition, etymology, status = fetch_definition(word)
-        
-        if status == "success" and (definition or etymology):
-            word_data[word]["d"] = definition or ""
-            word_data[word]["e"] = etymology or ""
-            progress["completed"][filename].append(word)
-            success_count += 1
-            modified = True
-            if (i + 1) % 10 == 0:
-                print(f" ✓ got definition")
-        else:
-            progress["failed"][filename][word] = status
-            fail_count += 1
-            if (i + 1) % 10 == 0:
-                print(f" ✗ {status}")
+    rate_limiter = RateLimiter(DELAY_BETWEEN_REQUESTS)
+    updates = open(updates_path, 'a')
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {executor.submit(fetch_definition, word, rate_limiter): word for word in words_needing_defs}
         
-        # Save progress periodically
-        if (i + 1) % 50 == 0:
-            save_progress(progress)
-            # Also save the word data periodically
-            if modified:
-                with open(filepath, 'w') as f:
-                    json.dump(word_data, f, separators=(',', ':'))
+        for i, future in enumerate(as_completed(futures)):
+            word = futures[future]
+            
+            # Progress indicator
+            if (i + 1) % 10 == 0 or i == 0:
+                print(f"  [{i+1}/{total_words}] Processing {word}...", end="", flush=True)
+            
+            definition, etymology, status = future.result()
+            
+            if status == "success" and (definition or etymology):
+                word_data[word]["d"] = definition or ""
+                word_data[word]["e"] = etymology or ""
+                updates.write(json.dumps({"w": word, "d": word_data[word]["d"], "e": word_data[word]["e"]}) + "\n")
+                updates.flush()
+                completed.add(word)
+                success_count += 1
+                modified = True
+                if (i + 1) % 10 == 0:
+                    print(f" ✓ got definition")
+            else:
+                failed[word] = status
+                fail_count += 1
+                if (i + 1) % 10 == 0:
+                    print(f" ✗ {status}")
+            
+            # Save progress periodically
+            if (i + 1) % 50 == 0:
+                save_progress(progress)
                 print(f"  [Saved progress: {success_count} new definitions]")
-        
-        # Rate limiting
-        time.sleep(DELAY_BETWEEN_REQUESTS)
+    finally:
+        # Don't wait for queued lookups if we were interrupted
+        executor.shutdown(wait=True, cancel_futures=True)
+        updates.close()
     
-    # Final save
+    # Final save: merge the logged definitions into the word file in one write
     save_progress(progress)
     if modified:
-        with open(filepath, 'w') as f:
-            json.dump(word_data, f, separators=(',', ':'))
+        save_word_data(filepath, word_data)
+    os.remove(updates_path)
     
     print(f"\nCompleted {filename}: {success_count} definitions added, {fail_count} failed")
     return word_data, success_count, fail_count
@@ -12,29 +12,73 @@ Downloads gently with exponential backoff on errors.
 Saves data in JSON format.
 """
 
+import gzip
+import hashlib
+import itertools
 import json
 import os
 import re
+import sys
 import time
 import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin
-from html import unescape
 
-import requests
-from bs4 import BeautifulSoup
+# Check for required libraries here, where a missing one would first fail
+try:
+    import lxml.html
+    import orjson
+    import requests
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError as e:
+    print(f"Missing required library: {e}")
+    print("Install with: pip install requests beautifulsoup4 lxml orjson")
+    sys.exit(1)
 
 # Configuration
 BASE_URL = "https://ocdb.cc"
 EPISODES_URL = f"{BASE_URL}/episodes/"
+PAGE_ENCODING = "utf-8"  # Pages are handed to the parsers as raw bytes in this encoding
 OUTPUT_FILE = "only_connect_episodes.json"
+EPISODES_LOG = "only_connect_episodes.jsonl"  # One episode per line, appended as each is scraped
 PROGRESS_FILE = "scrape_progress.json"
+CACHE_DIR = "ocdb_cache"  # Gzipped episode pages, so reruns can re-parse without refetching
+CACHE_MAX_AGE = 30 * 86400  # Seconds before a cached page is fetched again
 
 # Rate limiting
 MIN_DELAY = 1.5  # Minimum seconds between requests
 MAX_DELAY = 3.0  # Maximum seconds between requests
 BACKOFF_FACTOR = 2  # Exponential backoff multiplier
 MAX_RETRIES = 5  # Maximum retry attempts
+CONCURRENCY = 4  # Episode pages in flight at once (request starts are still rate limited)
+PREFETCH = 2 * CONCURRENCY  # Episodes submitted ahead of the one being reported
+
+# Only build tree nodes for the tags the parsers read. Anything outside these
+# tags at the top level is skipped by the tree builder (content inside a kept
+# tag, like the page's wrapper div, is kept whole).
+EPISODE_STRAINER = SoupStrainer(['h1', 'h2', 'h3', 'div', 'a', 'img', 'label'])
+# Placeholder pages (e.g. specials with no rounds written up) only need the
+# title and metadata headers
+HEADER_STRAINER = SoupStrainer(['h1', 'h2'])
+
+# Patterns used while parsing, compiled once
+EPISODE_NUM_RE = re.compile(r'Episode\s*(\d+)')
+EPISODE_PREFIX_RE = re.compile(r'^Episode\s*\d+:\s*')
+SERIES_NUM_RE = re.compile(r'Series\s*(\d+)')
+ROUND_ID_RE = re.compile(r'^round\d$')
+ROUND_TEXT_RE = re.compile(r'Round (\d)')
+MP3_RE = re.compile(r'\.mp3$')
+WALL_CELL_RE = re.compile(r'group[1-4]-(?:clue|answer)')
+WALL_CLUE_RE = re.compile(r'group([1-4])-clue')
+WALL_ANSWER_SPLIT_RE = re.compile(r'\s+Answer\s*')
+ROUND_MARKER_RE = re.compile(rb'round\d|Round \d')  # Any hint of a round header in the raw page
+CONSONANT_ONLY_RE = re.compile(r'^[B-DF-HJ-NP-TV-Zb-df-hj-np-tv-z\s]+$')
+VOWELS = frozenset('aeiouAEIOU')
 
 # Greek letter indices (early episodes)
 GREEK_LETTERS = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta']
@@ -45,46 +89,67 @@ EGYPTIAN_GLYPHS = [
     'Two Reeds', 'Horned Viper', 'Lion', 'Water', 'Twisted Flax', 'Eye of Horus'
 ]
 
+# (token, label) pairs searched in question headers, in priority order.
+# Glyph names match case-insensitively, Greek names and symbols exactly.
+EGYPTIAN_LABEL_TOKENS = tuple((glyph.lower(), glyph) for glyph in EGYPTIAN_GLYPHS)
+GREEK_LABEL_TOKENS = tuple(
+    (token, greek) for greek, symbol in zip(GREEK_LETTERS, GREEK_SYMBOLS) for token in (greek, symbol)
+)
+
 
 class RateLimiter:
-    """Handles rate limiting with exponential backoff."""
+    """Handles rate limiting with exponential backoff. Shared by worker threads."""
     
     def __init__(self):
         self.delay = MIN_DELAY
-        self.last_request = 0
+        self.last_request = float('-inf')  # monotonic() has no fixed epoch
+        self.lock = threading.Lock()
         
     def wait(self):
         """Wait before next request."""
-        elapsed = time.time() - self.last_request
-        wait_time = max(0, self.delay - elapsed)
+        # Reserve this thread's start time under the lock, then sleep outside it
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.last_request
+            wait_time = max(0.0, self.delay - elapsed)
+            if wait_time > 0:
+                # Add small random jitter
+                wait_time += random.random() * 0.5
+            self.last_request = now + wait_time
         if wait_time > 0:
-            # Add small random jitter
-            jitter = random.uniform(0, 0.5)
-            time.sleep(wait_time + jitter)
-        self.last_request = time.time()
+            time.sleep(wait_time)
         
     def success(self):
         """Call on successful request to reduce delay."""
-        self.delay = max(MIN_DELAY, self.delay * 0.9)
+        with self.lock:
+            self.delay = max(MIN_DELAY, self.delay * 0.9)
         
     def failure(self):
         """Call on failed request to increase delay."""
-        self.delay = min(MAX_DELAY * 10, self.delay * BACKOFF_FACTOR)
-        print(f"  Backing off, delay now {self.delay:.1f}s")
+        with self.lock:
+            self.delay = min(MAX_DELAY * 10, self.delay * BACKOFF_FACTOR)
+            delay = self.delay
+        print(f"  Backing off, delay now {delay:.1f}s")
 
 
 class OCDBScraper:
     """Scraper for the Only Connect Database."""
     
-    def __init__(self):
+    def __init__(self, cache_max_age: float = CACHE_MAX_AGE):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'OCDB Educational Scraper (gentle, rate-limited)',
             'Accept': 'text/html,application/xhtml+xml',
             'Accept-Language': 'en-GB,en;q=0.9',
         })
+        # Everything comes from one host: keep a persistent connection per
+        # worker. Retries are left to fetch_page, which also backs off.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY, max_retries=Retry(total=0))
+        self.session.mount('https://', adapter)
         self.rate_limiter = RateLimiter()
+        self.cache_max_age = cache_max_age
         self.episodes = []
+        self.episode_log = None
         self.progress = {'completed': [], 'failed': []}
         
     def load_progress(self):
@@ -100,16 +165,81 @@ class OCDBScraper:
                 self.episodes = json.load(f)
             print(f"Loaded {len(self.episodes)} existing episodes")
             
+        # Episodes scraped since the output file was last written. These are
+        # newer than any copy of the same episode in the output file.
+        if os.path.exists(EPISODES_LOG):
+            episodes_by_url = {ep['url']: ep for ep in self.episodes}
+            replayed = 0
+            with open(EPISODES_LOG, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        episode = json.loads(line)
+                    except ValueError:
+                        continue  # Partial line from an interrupted write
+                    episodes_by_url[episode['url']] = episode
+                    replayed += 1
+            self.episodes = list(episodes_by_url.values())
+            if replayed:
+                print(f"Replayed {replayed} episodes from {EPISODES_LOG}")
+                
+        # The merged episodes are what has actually been scraped
+        self.progress['completed'] = [ep['url'] for ep in self.episodes]
+            
     def save_progress(self):
         """Save progress for resume capability."""
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, indent=2)
+        with open(PROGRESS_FILE, 'wb') as f:
+            f.write(orjson.dumps(self.progress, option=orjson.OPT_INDENT_2))
             
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.episodes, f, indent=2, ensure_ascii=False)
+    def log_episode(self, episode: dict):
+        """Append a scraped episode to the JSON Lines log."""
+        self.episode_log.write(orjson.dumps(episode, option=orjson.OPT_APPEND_NEWLINE))
+        self.episode_log.flush()
+        
+    def finalize(self):
+        """Consolidate all episodes into the output file and clear the log."""
+        self.save_progress()
+        
+        tmp_path = OUTPUT_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(self.episodes, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, OUTPUT_FILE)
+        
+        # Everything in the log is now in the output file
+        if self.episode_log:
+            self.episode_log.truncate(0)
+        elif os.path.exists(EPISODES_LOG):
+            os.remove(EPISODES_LOG)
             
-    def fetch_page(self, url: str) -> BeautifulSoup | None:
-        """Fetch a page with rate limiting and retries."""
+    def cache_path(self, url: str) -> str:
+        """Path of the cached copy of a page."""
+        return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html.gz')
+        
+    def cache_is_fresh(self, cache_path: str) -> bool:
+        """Whether a cached copy exists and is younger than the maximum cache age."""
+        try:
+            return time.time() - os.path.getmtime(cache_path) < self.cache_max_age
+        except OSError:
+            return False
+        
+    def fetch_page(self, url: str, use_cache: bool = True) -> BeautifulSoup | None:
+        """Fetch and parse an episode page, or parse it from the page cache."""
+        html = self.fetch_html(url, use_cache=use_cache)
+        if html is None:
+            return None
+        # A byte scan is far cheaper than building the full tree for a page
+        # with no rounds to parse
+        parse_only = EPISODE_STRAINER if ROUND_MARKER_RE.search(html) else HEADER_STRAINER
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only, from_encoding=PAGE_ENCODING)
+        
+    def fetch_html(self, url: str, use_cache: bool = True) -> bytes | None:
+        """Fetch a page's HTML with rate limiting and retries, or from the page cache."""
+        cache_path = self.cache_path(url)
+        if use_cache and self.cache_is_fresh(cache_path):
+            # Cached pages skip the network and the rate limiter entirely.
+            # Stale ones are refetched below and the cache is overwritten.
+            with gzip.open(cache_path, 'rb') as f:
+                return f.read()
+                
         for attempt in range(MAX_RETRIES):
             self.rate_limiter.wait()
             
@@ -118,7 +248,15 @@ class OCDBScraper:
                 
                 if response.status_code == 200:
                     self.rate_limiter.success()
-                    return BeautifulSoup(response.text, 'html.parser')
+                    content_type = response.headers.get('Content-Type', '')
+                    if not content_type.startswith('text/html'):
+                        print(f"  Not an HTML page ({content_type or 'no content type'}): {url}")
+                        return None
+                    # The raw bytes go straight to the parser, which decodes
+                    # them itself, rather than through response.text
+                    if use_cache:
+                        self.save_to_cache(cache_path, response.content)
+                    return response.content
                     
                 elif response.status_code == 429:  # Too Many Requests
                     print(f"  Rate limited (429), backing off...")
@@ -143,44 +281,65 @@ class OCDBScraper:
         print(f"  Failed after {MAX_RETRIES} attempts")
         return None
         
+    def save_to_cache(self, cache_path: str, html: bytes):
+        """Store a fetched page, via a temp file so a crash can't leave a partial copy."""
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(html)
+        os.replace(tmp_path, cache_path)
+        
     def get_episode_urls(self) -> list[dict]:
         """Get all episode URLs from the episodes page."""
         print("Fetching episode list...")
-        soup = self.fetch_page(EPISODES_URL)
+        # The index changes as episodes are added, so it is always fetched fresh
+        html = self.fetch_html(EPISODES_URL, use_cache=False)
         
-        if not soup:
+        if not html:
             print("Failed to fetch episode list!")
             return []
             
         episodes = []
+        seen_urls = set()
         current_series = None
         
-        # Find the episode list container
-        content = soup.find('div', class_='episode-list') or soup.find('div', class_='content')
-        if not content:
-            content = soup
+        # This page is large and only needs tags, links and text, so it is
+        # walked with lxml directly rather than through a BeautifulSoup tree
+        parser = lxml.html.HTMLParser(encoding=PAGE_ENCODING)
+        page = lxml.html.fromstring(html, parser=parser)
+        
+        # Find the episode list container, so sidebar and footer links to
+        # episodes are not picked up
+        content = next((div for class_name in ('episode-list', 'content')
+                        for div in page.find_class(class_name) if div.tag == 'div'), page)
             
-        # Look for series headers and episode links
-        for element in content.find_all(['h2', 'a']):
-            if element.name == 'h2':
+        # Look for series headers and episode links, in document order
+        for element in content.iter('h2', 'a'):
+            if element.tag == 'h2':
                 # Series header like "Series 1" or "Series Specials"
-                text = element.get_text(strip=True)
+                text = self.element_text(element)
                 if text.startswith('Series'):
                     current_series = text
                     
-            elif element.name == 'a' and current_series:
+            elif current_series:
                 href = element.get('href', '')
                 if '/episode/' in href:
-                    title = element.get_text(strip=True)
+                    url = urljoin(BASE_URL, href)
+                    # An episode linked more than once is only scraped once
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                    
+                    title = self.element_text(element)
                     # Extract episode number from title
-                    ep_match = re.search(r'Episode\s*(\d+)', title)
+                    ep_match = EPISODE_NUM_RE.search(title)
                     ep_num = int(ep_match.group(1)) if ep_match else None
                     
                     # Clean up title
-                    clean_title = re.sub(r'^Episode\s*\d+:\s*', '', title).strip()
+                    clean_title = EPISODE_PREFIX_RE.sub('', title).strip()
                     
                     episodes.append({
-                        'url': urljoin(BASE_URL, href),
+                        'url': url,
                         'series': current_series,
                         'episode_number': ep_num,
                         'title': clean_title
@@ -189,14 +348,17 @@ class OCDBScraper:
         print(f"Found {len(episodes)} episodes")
         return episodes
         
+    def element_text(self, element) -> str:
+        """Concatenate an lxml element's stripped text, like bs4's get_text(strip=True)."""
+        return ''.join(text.strip() for text in element.itertext())
+        
     def clean_text(self, element) -> str:
         """Extract clean text from an element."""
         if element is None:
             return ""
-        text = element.get_text(separator=' ', strip=True)
-        text = unescape(text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # lxml has already decoded entities; split() also collapses runs of
+        # whitespace inside a single string
+        return ' '.join(' '.join(element.stripped_strings).split())
         
     def extract_clues(self, container) -> list[str]:
         """Extract clue text from a round container."""
@@ -207,7 +369,7 @@ class OCDBScraper:
         
         for clue_div in clue_divs:
             # Check for audio link (music clue)
-            audio_link = clue_div.find('a', href=re.compile(r'\.mp3$'))
+            audio_link = clue_div.find('a', href=MP3_RE)
             if audio_link:
                 clues.append({'type': 'audio', 'url': audio_link['href']})
                 continue
@@ -249,122 +411,136 @@ class OCDBScraper:
             return self.clean_text(answer_div)
         return ""
         
-    def parse_connection_round(self, soup, round_num: int) -> list[dict]:
-        """Parse a connection round (Round 1 or 2)."""
+    def find_round_headers(self, soup) -> dict:
+        """Locate each round's h2 header ('round1'..'round4') in one pass over the page."""
+        by_id = {}
+        by_text = {}
+        for h2 in soup.find_all('h2'):
+            h2_id = h2.get('id', '')
+            if ROUND_ID_RE.match(h2_id):
+                by_id.setdefault(h2_id, h2)
+            else:
+                # Older pages: fall back to a header reading "Round N"
+                text_match = ROUND_TEXT_RE.search(h2.string or '')
+                if text_match:
+                    by_text.setdefault(f'round{text_match.group(1)}', h2)
+        return {**by_text, **by_id}
+        
+    def question_sections(self, round_header, *grid_classes) -> list[tuple]:
+        """Pair each h3 in a round with the first later sibling div of grid_classes.
+
+        Walks the header's siblings once, back to front, so every h3 already
+        knows the nearest following div of each class.  Like the old
+        find_next_sibling() lookups, the div may lie past the end of the round.
+        """
+        sections = []
+        nearest = dict.fromkeys(grid_classes)
+        siblings = [el for el in round_header.next_siblings if isinstance(el, Tag)]
+        for element in reversed(siblings):
+            if element.name == 'h3':
+                grid = next((nearest[cls] for cls in grid_classes if nearest[cls]), None)
+                sections.append((element, grid))
+            elif element.name == 'div':
+                classes = element.get('class') or ()
+                for cls in grid_classes:
+                    if cls in classes:
+                        nearest[cls] = element
+            elif element.name == 'h2' and 'Round' in element.get_text():
+                # Anything after the next round header belongs to that round
+                sections.clear()
+        sections.reverse()
+        return sections
+        
+    def parse_connection_round(self, round_header) -> list[dict]:
+        """Parse a connection round (Round 1 or 2) from its header."""
         questions = []
         
-        # Find the round header
-        round_id = f'round{round_num}'
-        round_header = soup.find('h2', id=round_id) or soup.find('h2', string=re.compile(f'Round {round_num}'))
-        
         if not round_header:
             return questions
             
-        # Get all h3 headers (question labels) until next round
-        current = round_header.find_next_sibling()
-        
-        while current:
-            # Stop at next round
-            if current.name == 'h2' and 'Round' in current.get_text():
-                break
-                
-            if current.name == 'h3':
-                label_text = current.get_text(strip=True)
+        # Each h3 (question label) is followed by its grid container
+        for header, grid in self.question_sections(round_header, 'round', 'grid-container'):
+            label_text = header.get_text(strip=True)
+            
+            if grid:
+                clues = self.extract_clues(grid)
+                answer = self.extract_answer(grid)
                 
-                # Find the grid container following this h3
-                grid = current.find_next_sibling('div', class_='round')
-                if not grid:
-                    grid = current.find_next_sibling('div', class_='grid-container')
-                    
-                if grid:
-                    clues = self.extract_clues(grid)
-                    answer = self.extract_answer(grid)
-                    
-                    # Determine the index label
-                    index_label = None
-                    for i, (greek, symbol) in enumerate(zip(GREEK_LETTERS, GREEK_SYMBOLS)):
-                        if greek in label_text or symbol in label_text:
-                            index_label = greek
-                            break
-                    for glyph in EGYPTIAN_GLYPHS:
-                        if glyph.lower() in label_text.lower():
-                            index_label = glyph
-                            break
-                            
-                    questions.append({
-                        'label': index_label or label_text,
-                        'clues': clues,
-                        'answer': answer
-                    })
-                    
-            current = current.find_next_sibling()
+                # Determine the index label (a glyph name wins over a Greek one)
+                lowered = label_text.lower()
+                index_label = next((glyph for token, glyph in EGYPTIAN_LABEL_TOKENS if token in lowered), None)
+                if index_label is None:
+                    index_label = next((greek for token, greek in GREEK_LABEL_TOKENS if token in label_text), None)
+                        
+                questions.append({
+                    'label': index_label or label_text,
+                    'clues': clues,
+                    'answer': answer
+                })
             
         return questions
         
-    def parse_wall_round(self, soup) -> list[dict]:
-        """Parse Round 3 (Connecting Wall)."""
+    def parse_wall_round(self, round_header) -> list[dict]:
+        """Parse Round 3 (Connecting Wall) from its header."""
         walls = []
         
-        round_header = soup.find('h2', id='round3') or soup.find('h2', string=re.compile('Round 3'))
-        
         if not round_header:
             return walls
             
-        current = round_header.find_next_sibling()
-        
-        while current:
-            if current.name == 'h2' and 'Round' in current.get_text():
-                break
-                
-            if current.name == 'h3':
-                label_text = current.get_text(strip=True)
-                
-                # Find the question div containing wall-container
-                question_div = current.find_next_sibling('div', class_='question')
+        for header, question_div in self.question_sections(round_header, 'question'):
+            label_text = header.get_text(strip=True)
+            
+            if question_div:
+                groups = []
+                wall_container = question_div.find('div', class_='wall-container')
                 
-                if question_div:
-                    groups = []
-                    wall_container = question_div.find('div', class_='wall-container')
-                    
-                    if wall_container:
-                        # Parse the 4 groups (group1, group2, group3, group4)
-                        for group_num in range(1, 5):
-                            group_class = f'group{group_num}'
-                            items = []
-                            connection = ""
-                            
-                            # Find all clue cells for this group
-                            for clue_cell in wall_container.find_all('div', class_=re.compile(f'{group_class}-clue')):
-                                clue_div = clue_cell.find('div', class_='clue')
-                                if clue_div:
-                                    text = self.clean_text(clue_div)
-                                    if text:
-                                        items.append(text)
-                                        
-                            # Find the answer for this group
-                            answer_label = wall_container.find('label', class_=f'{group_class}-answer')
-                            if answer_label:
-                                back = answer_label.find('div', class_='back')
-                                if back:
-                                    connection = self.clean_text(back)
+                if wall_container:
+                    # Collect the clue cells and answer label of all 4 groups
+                    # (group1..group4) in one pass over the wall
+                    clue_cells = [[], [], [], []]
+                    answer_labels = [None, None, None, None]
+                    for cell in wall_container.find_all(['div', 'label'], class_=WALL_CELL_RE):
+                        classes = cell.get('class')
+                        if cell.name == 'div':
+                            group_nums = {int(match.group(1)) for match in map(WALL_CLUE_RE.search, classes) if match}
+                            for group_num in sorted(group_nums):
+                                clue_cells[group_num - 1].append(cell)
+                        else:
+                            for group_num in range(1, 5):
+                                if answer_labels[group_num - 1] is None and f'group{group_num}-answer' in classes:
+                                    answer_labels[group_num - 1] = cell
                                     
-                            if items or connection:
-                                groups.append({
-                                    'items': items,
-                                    'connection': connection
-                                })
-                    else:
-                        # Fallback: try to extract raw text
-                        text = self.clean_text(question_div)
-                        if text:
-                            groups = self.parse_wall_raw_text(text)
-                            
-                    walls.append({
-                        'label': label_text,
-                        'groups': groups
-                    })
-                    
-            current = current.find_next_sibling()
+                    for cells, answer_label in zip(clue_cells, answer_labels):
+                        items = []
+                        connection = ""
+                        
+                        for clue_cell in cells:
+                            clue_div = clue_cell.find('div', class_='clue')
+                            if clue_div:
+                                text = self.clean_text(clue_div)
+                                if text:
+                                    items.append(text)
+                                    
+                        if answer_label:
+                            back = answer_label.find('div', class_='back')
+                            if back:
+                                connection = self.clean_text(back)
+                                
+                        if items or connection:
+                            groups.append({
+                                'items': items,
+                                'connection': connection
+                            })
+                else:
+                    # Fallback: try to extract raw text
+                    text = self.clean_text(question_div)
+                    if text:
+                        groups = self.parse_wall_raw_text(text)
+                        
+                walls.append({
+                    'label': label_text,
+                    'groups': groups
+                })
             
         return walls
         
@@ -373,7 +549,7 @@ class OCDBScraper:
         groups = []
         
         # Split on "Answer" markers which typically follow the connection
-        parts = re.split(r'\s+Answer\s*', text)
+        parts = WALL_ANSWER_SPLIT_RE.split(text)
         
         for part in parts:
             part = part.strip()
@@ -396,17 +572,15 @@ class OCDBScraper:
                 
         return groups
         
-    def parse_vowels_round(self, soup) -> list[dict]:
-        """Parse Round 4 (Missing Vowels)."""
+    def parse_vowels_round(self, round_header) -> list[dict]:
+        """Parse Round 4 (Missing Vowels) from its header."""
         categories = []
         
-        round_header = soup.find('h2', id='round4') or soup.find('h2', string=re.compile('Round 4'))
-        
         if not round_header:
             return categories
             
         # Find the vowel round container
-        vowel_div = soup.find('div', class_='vowel-round')
+        vowel_div = round_header.find_next('div', class_='vowel-round')
         
         if vowel_div:
             current_category = ""
@@ -475,37 +649,22 @@ class OCDBScraper:
         
         current_category = ""
         current_clues = []
-        i = 0
         
-        while i < len(words):
-            word = words[i]
-            
-            # Check if word contains vowels (likely category or answer)
-            has_vowels = bool(re.search(r'[aeiouAEIOU]', word))
-            
-            # Look for all-caps consonant patterns (clues)
-            is_consonant_clue = bool(re.match(r'^[B-DF-HJ-NP-TV-Zb-df-hj-np-tv-z\s]+$', word))
-            
-            if has_vowels and not is_consonant_clue:
+        # Classify each word once and walk the runs of vowel / vowel-less words.
+        # The bound isdisjoint (True for a vowel-less word) is used directly as
+        # the key: it beats both a wrapping lambda and a str.translate length check.
+        runs = [(not vowel_less, list(run)) for vowel_less, run
+                in itertools.groupby(words, key=VOWELS.isdisjoint)]
+        
+        for run_index, (has_vowels, run) in enumerate(runs):
+            if has_vowels:
                 # This might be a category name or an answer
                 # Categories are usually longer phrases at the start of a section
-                
-                # Collect consecutive words with vowels
-                phrase_words = [word]
-                j = i + 1
-                while j < len(words):
-                    next_word = words[j]
-                    if re.search(r'[aeiouAEIOU]', next_word):
-                        phrase_words.append(next_word)
-                        j += 1
-                    else:
-                        break
-                        
-                phrase = ' '.join(phrase_words)
+                phrase = ' '.join(run)
                 
                 # Heuristic: if phrase is long and followed by consonant-only words,
                 # it's likely a category
-                if j < len(words) and not re.search(r'[aeiouAEIOU]', words[j]):
+                if run_index + 1 < len(runs):
                     # Save previous category if exists
                     if current_category or current_clues:
                         categories.append({
@@ -520,24 +679,17 @@ class OCDBScraper:
                         current_clues[-1]['answer'] = phrase
                     else:
                         current_clues.append({'answer': phrase})
-                        
-                i = j
             else:
-                # Consonant-only clue
-                # Collect consecutive consonant-only words
-                clue_words = [word]
-                j = i + 1
-                while j < len(words):
-                    next_word = words[j]
-                    if not re.search(r'[aeiouAEIOU]', next_word) and re.match(r'^[B-DF-HJ-NP-TV-Zb-df-hj-np-tv-z\s]+$', next_word):
-                        clue_words.append(next_word)
-                        j += 1
-                    else:
-                        break
-                        
-                clue = ' '.join(clue_words)
-                current_clues.append({'clue': clue, 'answer': ''})
-                i = j
+                # Consonant-only clues: consecutive consonant-only words form one
+                # clue, and any other vowel-less word (digits, punctuation) starts
+                # a new one
+                clue_words = []
+                for word in run:
+                    if clue_words and not CONSONANT_ONLY_RE.match(word):
+                        current_clues.append({'clue': ' '.join(clue_words), 'answer': ''})
+                        clue_words = []
+                    clue_words.append(word)
+                current_clues.append({'clue': ' '.join(clue_words), 'answer': ''})
                 
         # Save last category
         if current_category or current_clues:
@@ -572,8 +724,8 @@ class OCDBScraper:
         meta_h2 = soup.find('h2', class_='episode_meta')
         if meta_h2:
             meta_text = self.clean_text(meta_h2)
-            series_match = re.search(r'Series\s*(\d+)', meta_text)
-            ep_match = re.search(r'Episode\s*(\d+)', meta_text)
+            series_match = SERIES_NUM_RE.search(meta_text)
+            ep_match = EPISODE_NUM_RE.search(meta_text)
             
             if series_match:
                 try:
@@ -587,10 +739,11 @@ class OCDBScraper:
                     pass
                     
         # Parse each round
-        episode['round1'] = self.parse_connection_round(soup, 1)
-        episode['round2'] = self.parse_connection_round(soup, 2)
-        episode['round3'] = self.parse_wall_round(soup)
-        episode['round4'] = self.parse_vowels_round(soup)
+        round_headers = self.find_round_headers(soup)
+        episode['round1'] = self.parse_connection_round(round_headers.get('round1'))
+        episode['round2'] = self.parse_connection_round(round_headers.get('round2'))
+        episode['round3'] = self.parse_wall_round(round_headers.get('round3'))
+        episode['round4'] = self.parse_vowels_round(round_headers.get('round4'))
         
         return episode
         
@@ -617,34 +770,62 @@ class OCDBScraper:
         if max_episodes:
             to_scrape = to_scrape[:max_episodes]
             
-        # Scrape each episode
-        for i, ep_info in enumerate(to_scrape):
-            print(f"[{i+1}/{len(to_scrape)}] Scraping: {ep_info['title']}")
+        # A fresh run clears the output, progress and log together, so an
+        # interrupted fresh run resumes from a consistent state
+        if not resume:
+            self.finalize()
             
-            try:
-                episode = self.parse_episode(ep_info['url'], ep_info)
+        # Episodes are logged as they complete
+        self.episode_log = open(EPISODES_LOG, 'ab')
+        
+        # Scrape episodes concurrently; results are handled in list order so
+        # the output and progress stay in the same order as before
+        executor = ThreadPoolExecutor(max_workers=CONCURRENCY)
+        try:
+            # Keep a bounded window of episodes queued, so finished results
+            # never pile up far ahead of a slow page
+            futures = deque(executor.submit(self.parse_episode, ep_info['url'], ep_info)
+                            for ep_info in to_scrape[:PREFETCH])
+            
+            for i, ep_info in enumerate(to_scrape):
+                future = futures.popleft()
+                if i + PREFETCH < len(to_scrape):
+                    next_info = to_scrape[i + PREFETCH]
+                    futures.append(executor.submit(self.parse_episode, next_info['url'], next_info))
+                    
+                print(f"[{i+1}/{len(to_scrape)}] Scraping: {ep_info['title']}")
                 
-                if episode:
-                    self.episodes.append(episode)
-                    self.progress['completed'].append(ep_info['url'])
-                    r4_clues = sum(len(c.get('clues', [])) for c in episode['round4'])
-                    print(f"  ✓ Extracted: R1={len(episode['round1'])}, R2={len(episode['round2'])}, "
-                          f"R3={len(episode['round3'])} walls, R4={r4_clues} clues")
-                else:
+                try:
+                    episode = future.result()
+                    
+                    if episode:
+                        self.episodes.append(episode)
+                        self.log_episode(episode)
+                        self.progress['completed'].append(ep_info['url'])
+                        r4_clues = sum(len(c.get('clues', [])) for c in episode['round4'])
+                        print(f"  ✓ Extracted: R1={len(episode['round1'])}, R2={len(episode['round2'])}, "
+                              f"R3={len(episode['round3'])} walls, R4={r4_clues} clues")
+                    else:
+                        self.progress['failed'].append(ep_info['url'])
+                        print(f"  ✗ Failed to parse")
+                        
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
                     self.progress['failed'].append(ep_info['url'])
-                    print(f"  ✗ Failed to parse")
                     
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                self.progress['failed'].append(ep_info['url'])
-                
-            # Save progress periodically
-            if (i + 1) % 10 == 0:
-                self.save_progress()
-                print(f"  Progress saved ({len(self.episodes)} episodes)")
+                # Save progress periodically
+                if (i + 1) % 10 == 0:
+                    self.save_progress()
+                    print(f"  Progress saved ({len(self.episodes)} episodes)")
+                    
+            # Final save
+            self.finalize()
+        finally:
+            # Drop queued episodes rather than waiting for them if interrupted
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.episode_log.close()
+            self.episode_log = None
                 
-        # Final save
-        self.save_progress()
         print(f"\nComplete! Saved {len(self.episodes)} episodes to {OUTPUT_FILE}")
         
         if self.progress['failed']:
@@ -660,19 +841,12 @@ def main():
     parser.add_argument('--max', type=int, help='Maximum episodes to scrape')
     parser.add_argument('--no-resume', action='store_true', help='Start fresh, ignore progress')
     parser.add_argument('--test', action='store_true', help='Test mode: scrape just 3 episodes')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Refetch every episode page, refreshing the page cache')
     
     args = parser.parse_args()
     
-    # Check for required libraries
-    try:
-        import requests
-        from bs4 import BeautifulSoup
-    except ImportError as e:
-        print(f"Missing required library: {e}")
-        print("Install with: pip install requests beautifulsoup4")
-        return
-        
-    scraper = OCDBScraper()
+    scraper = OCDBScraper(cache_max_age=0 if args.no_cache else CACHE_MAX_AGE)
     
     max_eps = args.max
     if args.test: